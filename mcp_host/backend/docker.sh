@@ -16,12 +16,27 @@ log() {
 # Script is in mcp_host/backend/docker.sh, so project root is two levels up.
 PROJECT_ROOT=$(cd "$(dirname "$0")/../.." && pwd)
 
-log "Authenticating with Docker..."
-gcloud auth print-access-token | docker login -u oauth2accesstoken --password-stdin ${REGISTRY_DOMAIN}
+# The caller sets SKIP_DOCKER_LOGIN=1 once the gcloud credential helper is
+# registered in ~/.docker/config.json; docker then mints tokens on demand and
+# the explicit login round trip is unnecessary.
+if [ "${SKIP_DOCKER_LOGIN}" != "1" ]; then
+  log "Authenticating with Docker..."
+  gcloud auth print-access-token | docker login -u oauth2accesstoken --password-stdin ${REGISTRY_DOMAIN}
+fi
 
 log "Building Docker image: ${IMAGE} using Dockerfile ${PROJECT_ROOT}/${DEPLOY_DIR}/Dockerfile and context ${PROJECT_ROOT}"
-# Use absolute paths for Dockerfile and context
-docker build --build-arg DEPLOY_DIR_ARG="${DEPLOY_DIR}" -t "${IMAGE}" -f "${PROJECT_ROOT}/${DEPLOY_DIR}/Dockerfile" "${PROJECT_ROOT}"
+# Use absolute paths for Dockerfile and context.
+# BUILDKIT_INLINE_CACHE embeds cache metadata in the pushed image so the next
+# build can reuse unchanged layers from the registry via --cache-from.
+# IMAGE may carry a content-hash tag; cache against the :latest tag of the
+# same repository path.
+CACHE_REF="${IMAGE%:*}:latest"
+docker build \
+  --build-arg DEPLOY_DIR_ARG="${DEPLOY_DIR}" \
+  --build-arg BUILDKIT_INLINE_CACHE=1 \
+  --cache-from "${CACHE_REF}" \
+  -t "${IMAGE}" \
+  -f "${PROJECT_ROOT}/${DEPLOY_DIR}/Dockerfile" "${PROJECT_ROOT}"
 
 # log "Attempting to run the container locally for testing on port ${LOCAL_TEST_PORT}..."
 # log "The image to be tested is: ${IMAGE}"
@@ -36,4 +51,12 @@ log "Local container test finished (or was stopped)."
 log "Proceeding to push Docker image to ${REGISTRY_DOMAIN}..."
 docker push ${IMAGE}
 
-log "Docker build and push completed successfully" 
\ No newline at end of file
+# Keep :latest pointing at the newest build so the next build's --cache-from
+# ref always resolves. The layers are shared with the content-tagged push, so
+# this only uploads a manifest.
+if [ "${IMAGE}" != "${CACHE_REF}" ]; then
+  docker tag "${IMAGE}" "${CACHE_REF}"
+  docker push "${CACHE_REF}"
+fi
+
+log "Docker build and push completed successfully"
\ No newline at end of file
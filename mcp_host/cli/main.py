@@ -3,36 +3,38 @@ CLI entry point for the MCP Hosting Service.
 """
 
 import typer
-from typing import Optional, List
+from typing import Any, Dict, List, Optional
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
-from rich import print as rprint
 import os
+import functools
 import importlib
-import inspect
+import types
 import asyncio
 import ast
+import re
 import sys
-from typing import Any, Dict
-from urllib.parse import urlparse
-import importlib
-import inspect
+import json
+import string
 import subprocess
-import http.server
-import socketserver
 import time
 import datetime
-from mcp.server.fastmcp import Context, FastMCP
-from mcp.client.session import ClientSession
-from mcp.client.sse import sse_client
 
-from ..backend.deployment import DeploymentManager
+import logging
+
+# Configure logging once at the application entry point; library modules only
+# create their own loggers.
+logging.basicConfig(level=logging.INFO)
 
 cli = typer.Typer(
     name="mcp-host",
     help="MCP Server Hosting Service CLI",
     add_completion=False,
+    # Skip Rich help markup and traceback installation; both add import-time
+    # and per-invocation work that a short-lived CLI never earns back.
+    rich_markup_mode=None,
+    pretty_exceptions_enable=False,
 )
 console = Console()
 
@@ -40,165 +42,324 @@ console = Console()
 SSE_PORT = 10000
 SSE_HOST = "localhost"
 
-# SSE Handler Class
-class SSEHandler(http.server.SimpleHTTPRequestHandler):
-    def do_GET(self):
-        if self.path == '/events':
-            self.send_response(200)
-            self.send_header('Content-Type', 'text/event-stream')
-            self.send_header('Cache-Control', 'no-cache')
-            self.send_header('Access-Control-Allow-Origin', '*') # Allow all origins
-            self.end_headers()
-            try:
-                while True:
-                    # Send current time as an event
-                    current_time = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                    message = f"data: Server time: {current_time}\n\n"
-                    self.wfile.write(message.encode('utf-8'))
-                    self.wfile.flush()
-                    time.sleep(1)  # Send an event every 1 second
-            except BrokenPipeError:
-                # Client disconnected
-                console.print("[yellow]SSE Client disconnected.[/yellow]")
-            except ConnectionAbortedError:
-                console.print("[yellow]SSE Connection aborted by client.[/yellow]")
-            except Exception as e:
-                console.print(f"[red]An error occurred in SSE handler: {e}[/red]")
-        elif self.path == '/':
-            self.send_response(200)
-            self.send_header('Content-Type', 'text/html')
-            self.end_headers()
-            html_content = """
-            <!DOCTYPE html>
-            <html>
-            <head>
-                <title>SSE Client</title>
-            </head>
-            <body>
-                <h1>Server-Sent Events (SSE)</h1>
-                <div id="sse-data">Waiting for data...</div>
-
-                <script>
-                    const eventSource = new EventSource('/events');
-                    const sseDataDiv = document.getElementById('sse-data');
-
-                    eventSource.onmessage = function(event) {
-                        const newElement = document.createElement("p");
-                        newElement.textContent = event.data;
-                        sseDataDiv.appendChild(newElement);
-                        // Scroll to the bottom
-                        window.scrollTo(0, document.body.scrollHeight);
-                    };
-
-                    eventSource.onerror = function(err) {
-                        console.error("EventSource failed:", err);
-                        sseDataDiv.textContent = "Error connecting to SSE. Check console.";
-                        eventSource.close();
-                    };
-                </script>
-            </body>
-            </html>
-            """
-            self.wfile.write(html_content.encode('utf-8'))
-        else:
-            self.send_error(404, "File not found")
+# Encoded once at import; HTMLResponse passes bytes straight through, so
+# serving "/" skips a full-page UTF-8 encode per request.
+_SSE_INDEX_HTML = b"""
+<!DOCTYPE html>
+<html>
+<head>
+    <title>SSE Client</title>
+</head>
+<body>
+    <h1>Server-Sent Events (SSE)</h1>
+    <div id="sse-data">Waiting for data...</div>
+
+    <script>
+        const eventSource = new EventSource('/events');
+        const sseDataDiv = document.getElementById('sse-data');
+
+        eventSource.onmessage = function(event) {
+            const newElement = document.createElement("p");
+            newElement.textContent = event.data;
+            sseDataDiv.appendChild(newElement);
+            // Scroll to the bottom
+            window.scrollTo(0, document.body.scrollHeight);
+        };
+
+        eventSource.onerror = function(err) {
+            console.error("EventSource failed:", err);
+            sseDataDiv.textContent = "Error connecting to SSE. Check console.";
+            eventSource.close();
+        };
+    </script>
+</body>
+</html>
+"""
 
-def get_gcloud_project():
-    """Try to get the default GCP project from gcloud config."""
+def _build_sse_app():
+    """Build the Starlette app that streams the server time over SSE.
+
+    All subscribers share one event loop, so each connection costs a coroutine
+    rather than a blocked OS thread like the old SimpleHTTPRequestHandler loop.
+    """
+    from starlette.applications import Starlette
+    from starlette.responses import HTMLResponse, PlainTextResponse, StreamingResponse
+    from starlette.routing import Route
+
+    # Fixed parts of each SSE frame, encoded once; the per-tick work is then a
+    # timestamp plus one bytes concatenation yielded as a single write.
+    data_prefix = b"data: Server time: "
+    frame_suffix = b"\n\n"
+
+    # Cap concurrent subscribers, and bound each subscriber's buffer so a slow
+    # client drops stale frames instead of growing memory without limit.
+    max_clients = 100
+    queue_depth = 16
+    client_slots = asyncio.Semaphore(max_clients)
+
+    # One broadcaster coroutine serves every subscriber: the timestamp is
+    # formatted and encoded once per tick and fanned out to each queue, so
+    # per-tick work is O(subscribers) queue puts rather than a wake-up plus a
+    # datetime format per connection. Started lazily on the first connection
+    # and stopped again when the last one leaves.
+    subscribers: set[asyncio.Queue] = set()
+    broadcaster: list[asyncio.Task] = []
+
+    def _enqueue(queue: asyncio.Queue, frame: bytes) -> None:
+        try:
+            queue.put_nowait(frame)
+        except asyncio.QueueFull:
+            # Drop the oldest frame; fresh data matters more than a backlog.
+            queue.get_nowait()
+            queue.put_nowait(frame)
+
+    async def _broadcast():
+        # Schedule against the monotonic clock so ticks stay on a fixed 1 Hz
+        # grid; a plain sleep(1) after the fan-out drifts by the work time of
+        # every iteration.
+        next_tick = time.monotonic() + 1.0
+        while True:
+            ts = datetime.datetime.now().isoformat(sep=" ", timespec="seconds")
+            frame = data_prefix + ts.encode("ascii") + frame_suffix
+            for queue in subscribers:
+                _enqueue(queue, frame)
+            await asyncio.sleep(max(0.0, next_tick - time.monotonic()))
+            next_tick += 1.0
+
+    async def events(request):
+        if client_slots.locked():
+            return PlainTextResponse("Too many SSE subscribers", status_code=503)
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=queue_depth)
+
+        async def event_stream():
+            async with client_slots:
+                subscribers.add(queue)
+                if not broadcaster:
+                    broadcaster.append(asyncio.create_task(_broadcast()))
+                try:
+                    while True:
+                        yield await queue.get()
+                finally:
+                    subscribers.discard(queue)
+                    if not subscribers:
+                        broadcaster.pop().cancel()
+
+        return StreamingResponse(
+            event_stream(),
+            media_type="text/event-stream",
+            headers={
+                "Cache-Control": "no-cache",
+                "Access-Control-Allow-Origin": "*",
+                # Tell nginx-style reverse proxies not to buffer the stream;
+                # buffered SSE looks like a silent stall to the client.
+                "X-Accel-Buffering": "no",
+            },
+        )
+
+    async def index(request):
+        return HTMLResponse(_SSE_INDEX_HTML)
+
+    return Starlette(routes=[Route("/", index), Route("/events", events)])
+
+@cli.command("serve-sse")
+def serve_sse(
+    host: str = typer.Option(SSE_HOST, help="Host to bind the SSE server to"),
+    port: int = typer.Option(SSE_PORT, help="Port to serve SSE events on"),
+):
+    """Serve the demo SSE endpoint on an asyncio event loop."""
+    import uvicorn
+
+    console.print(f"[green]Serving SSE events on http://{host}:{port}/events[/green]")
+    uvicorn.run(_build_sse_app(), host=host, port=port)
+
+_PROJECT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "mcp_host", "gcp_project")
+_PROJECT_CACHE_TTL = 86400  # The configured project changes rarely; refresh daily.
+
+@functools.lru_cache(maxsize=1)
+def _gcloud_config() -> dict:
+    """Fetch the entire gcloud config with one fork, cached per process.
+
+    One `gcloud config list` spawn serves every later lookup (project,
+    region, account) instead of paying a subprocess per key.
+    """
     try:
         result = subprocess.run(
-            ["gcloud", "config", "get-value", "project"],
+            ["gcloud", "config", "list", "--format=json"],
             check=True,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             text=True
         )
-        project_id = result.stdout.strip()
-        return project_id if project_id else "your-project-id"
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return "your-project-id"
+        return json.loads(result.stdout)
+    except (subprocess.CalledProcessError, FileNotFoundError, ValueError):
+        return {}
+
+def get_gcloud_region():
+    """Default deployment region from the environment or the gcloud config."""
+    return (
+        os.getenv("GCP_REGION")
+        or _gcloud_config().get("compute", {}).get("region")
+        or "us-central1"
+    )
 
-# Initialize deployment manager
-deployment_manager = DeploymentManager(
-    project_id=os.getenv("GCP_PROJECT_ID") or get_gcloud_project(),
-    region=os.getenv("GCP_REGION", "us-central1")
-)
+def get_gcloud_project():
+    """Resolve the default GCP project, avoiding a gcloud fork when possible.
 
-def get_tool_info(module):
-    """Get tool information from a module."""
+    Application Default Credentials usually carry the project with no
+    subprocess at all; failing that, the gcloud lookup result is cached on
+    disk so only one CLI invocation per day pays the fork.
+    """
+    try:
+        import google.auth
+        _, project_id = google.auth.default()
+        if project_id:
+            return project_id
+    except Exception:
+        pass
+
+    try:
+        if time.time() - os.path.getmtime(_PROJECT_CACHE_PATH) < _PROJECT_CACHE_TTL:
+            with open(_PROJECT_CACHE_PATH) as f:
+                cached = f.read().strip()
+            if cached:
+                return cached
+    except OSError:
+        pass
+
+    project_id = _gcloud_config().get("core", {}).get("project", "")
+    if not project_id:
+        return "your-project-id"
+
+    try:
+        os.makedirs(os.path.dirname(_PROJECT_CACHE_PATH), exist_ok=True)
+        with open(_PROJECT_CACHE_PATH, "w") as f:
+            f.write(project_id)
+    except OSError:
+        pass
+    return project_id
+
+@functools.lru_cache(maxsize=1)
+def _get_deployment_manager():
+    """Build the shared DeploymentManager on first use.
+
+    Constructing it eagerly at import time made every command — including
+    list-tools and serve-sse, which never touch Cloud Run — pay for project
+    resolution and GCP client setup.
+    """
+    from ..backend.deployment import DeploymentManager
+    return DeploymentManager(
+        project_id=os.getenv("GCP_PROJECT_ID") or get_gcloud_project(),
+        region=get_gcloud_region()
+    )
+
+# Single-pass underscore-to-space mapping for tool display names; avoids the
+# intermediate string that str.replace allocates before .title().
+_UNDERSCORE_TO_SPACE = str.maketrans("_", " ")
+
+@functools.lru_cache(maxsize=None)
+def _tool_info_for_module(module_name: str) -> tuple:
+    """Introspect one tool module, cached for the life of the process.
+
+    The signature walk is the expensive part and modules are immutable once
+    imported, so list_tools and create_server share a single pass per module.
+    Keyed by module name (hashable, stable) with the module looked up in
+    sys.modules.
+    """
+    module = sys.modules[module_name]
     tools = []
-    # Instead of looking for attributes, just collect all functions with docstrings
-    # that appear to be MCP tools (taking ctx as first parameter)
-    for name, func in inspect.getmembers(module, inspect.isfunction):
-        # Skip helper or internal functions
-        if name.startswith('_'):
+    # Walk the module namespace directly: inspect.getmembers sorts every
+    # attribute and getattr's each one, while __dict__ is already the dict we
+    # want. Collect plain functions that appear to be MCP tools (taking ctx
+    # as first parameter), preserving definition order.
+    for name, func in module.__dict__.items():
+        # Skip helper or internal functions and non-function attributes
+        if type(func) is not types.FunctionType or name.startswith('_'):
             continue
-        
-        # Get signature to check for Context parameter
+
+        # Read the first parameter name straight off the code object instead of
+        # building full inspect.signature Parameter objects just to compare it.
         try:
-            sig = inspect.signature(func)
-            params = list(sig.parameters.keys())
+            code = func.__code__
             # Check if it looks like an MCP tool (has ctx parameter)
-            if len(params) > 0 and params[0] == 'ctx':
+            if code.co_argcount > 0 and code.co_varnames[0] == 'ctx':
                 tools.append({
                     "id": name,
-                    "name": name.replace("_", " ").title(),
+                    "name": name.translate(_UNDERSCORE_TO_SPACE).title(),
                     "description": func.__doc__ or "",
-                    "version": "0.1.0", 
+                    "version": "0.1.0",
                     "author": "MCP Hosting Service"
                 })
-        except (ValueError, TypeError):
-            # Skip functions with invalid signatures
+        except AttributeError:
+            # Skip callables without a code object (e.g. C functions)
             pass
-            
-    return tools
 
-def _load_tool_modules() -> List[Any]:
-    """Dynamically discovers and loads tool modules from the 'mcp_host/tools' directory."""
-    loaded_modules = []
-    # Construct the path to the 'tools' directory relative to this file (main.py)
-    # main.py is in mcp_host/cli/, so ../tools points to mcp_host/tools/
-    tools_dir_path = os.path.join(os.path.dirname(__file__), "..", "tools")
-    
-    if not os.path.isdir(tools_dir_path):
-        console.print(f"[red]Tools directory not found at: {tools_dir_path}[/red]")
-        return []
-
-    for filename in os.listdir(tools_dir_path):
-        if filename.endswith(".py") and filename != "__init__.py":
-            module_name_simple = filename[:-3]
-            # The import path should be relative to the package root (mcp_host)
-            # e.g., mcp_host.tools.weather
-            module_import_path = f"mcp_host.tools.{module_name_simple}"
-            try:
-                module = importlib.import_module(module_import_path)
-                loaded_modules.append(module)
-            except ImportError as e:
-                console.print(f"[red]Failed to import tool module '{module_name_simple}': {e}[/red]")
-    return loaded_modules
+    return tuple(tools)
+
+def get_tool_info(module):
+    """Get tool information from a module."""
+    return list(_tool_info_for_module(module.__name__))
+
+@functools.lru_cache(maxsize=1)
+def _load_template() -> str:
+    """Read the server template once per process; it never changes at runtime."""
+    with open(os.path.join(os.path.dirname(__file__), "server_template.py"), "r") as f:
+        return f.read()
+
+# The tools directory sits next to this package: main.py is in mcp_host/cli/,
+# so ../tools points to mcp_host/tools/. Computed once at import.
+_TOOLS_DIR = os.path.join(os.path.dirname(__file__), "..", "tools")
+_TOOLS_PKG = "mcp_host.tools"
+
+@functools.lru_cache(maxsize=1)
+def _load_tool_modules() -> tuple:
+    """Dynamically discovers and loads tool modules from the 'mcp_host/tools' directory.
+
+    Discovery imports every tool module (and whatever they import), so it
+    runs lazily on first use rather than at import time — deploy/delete/url
+    commands never pay for it. The result is cached and returned as an
+    immutable tuple so every command iterates the same module objects in a
+    stable order, which downstream caches can rely on.
+    """
+    import pkgutil
 
-# Load tool modules once at startup, or call this function where needed
-ALL_TOOL_MODULES = _load_tool_modules()
+    loaded_modules = []
+    if not os.path.isdir(_TOOLS_DIR):
+        console.print(f"[red]Tools directory not found at: {_TOOLS_DIR}[/red]")
+        return ()
+
+    # iter_modules reuses one cached path finder instead of stat'ing each
+    # file individually the way a listdir + endswith loop does.
+    for module_info in pkgutil.iter_modules([_TOOLS_DIR]):
+        if module_info.ispkg:
+            continue
+        # e.g., mcp_host.tools.weather — already-imported modules (tests,
+        # REPL sessions) come straight out of sys.modules.
+        module_import_path = f"{_TOOLS_PKG}.{module_info.name}"
+        try:
+            module = sys.modules.get(module_import_path) or importlib.import_module(module_import_path)
+            loaded_modules.append(module)
+        except ImportError as e:
+            console.print(f"[red]Failed to import tool module '{module_info.name}': {e}[/red]")
+    return tuple(loaded_modules)
 
 @cli.command()
 def list_tools():
     """List all available pre-integrated tools."""
-    table = Table(title="Available Tools")
-    table.add_column("ID", style="cyan")
-    table.add_column("Name", style="green")
-    table.add_column("Description", style="yellow")
-    table.add_column("Version", style="blue")
-    table.add_column("Author", style="magenta")
+    # Tight padding and pre-sized narrow columns keep Rich's layout pass
+    # single-shot instead of re-measuring every column against every row.
+    table = Table(title="Available Tools", padding=(0, 1), pad_edge=False)
+    table.add_column("ID", style="cyan", min_width=12)
+    table.add_column("Name", style="green", min_width=12)
+    # A hard cap keeps long docstrings from forcing Rich to re-balance every
+    # other column against the full description text.
+    table.add_column("Description", style="yellow", max_width=60, overflow="fold")
+    table.add_column("Version", style="blue", width=7)
+    table.add_column("Author", style="magenta", min_width=11)
 
     # Get tools from each module
     all_tools = []
-    
-    console.print("[yellow]Searching for tools in mcp_host/tools/...[/yellow]")
-    for module in ALL_TOOL_MODULES:
-        console.print(f"[cyan]Module: {module.__name__}[/cyan]")
-        for name, func in inspect.getmembers(module, inspect.isfunction):
-            console.print(f"  Function: {name}")
-            console.print(f"  Attributes: {[attr for attr in dir(func) if attr.startswith('_mcp') or attr.startswith('__mcp')]}")
+    for module in _load_tool_modules():
         all_tools.extend(get_tool_info(module))
 
     for tool in all_tools:
@@ -218,71 +379,80 @@ def create_server(
     tools: str = typer.Option(..., help="Comma-separated list of tool identifiers"),
 ):
     """Create and configure a new MCP server."""
-    # Parse tool list
-    tool_ids = [t.strip() for t in tools.split(",")]
+    # Parse tool list: one pass that strips whitespace, drops empties from
+    # stray commas, and deduplicates while preserving order so the generated
+    # server never imports or binds the same tool twice.
+    tool_ids = list(dict.fromkeys(t for t in (s.strip() for s in tools.split(",")) if t))
+    if not tool_ids:
+        console.print("[red]Error: No tool IDs given. Provide a comma-separated list via --tools.[/red]")
+        return
     
-    # Validate tools
-    all_available_tools_info = []
-    # Use the dynamically loaded modules
-    if not ALL_TOOL_MODULES:
+    # Validate tools using the dynamically loaded modules
+    tool_modules = _load_tool_modules()
+    if not tool_modules:
         console.print("[red]Error: No tool modules were loaded. Cannot create server.[/red]")
         console.print("[dim]Please ensure your tools are in the 'mcp_host/tools' directory and are importable.[/dim]")
         return
 
-    for module in ALL_TOOL_MODULES:
-        all_available_tools_info.extend(get_tool_info(module))
-    
-    valid_tool_ids = {tool["id"] for tool in all_available_tools_info}
-    invalid_tools = [tool_id for tool_id in tool_ids if tool_id not in valid_tool_ids]
-    
+    # Reverse index built from the cached introspection: one dict lookup per
+    # requested tool instead of scanning every module with hasattr.
+    tool_to_module_key = {
+        tool["id"]: module.__name__.split(".")[-1]
+        for module in tool_modules
+        for tool in get_tool_info(module)
+    }
+
+    invalid_tools = [tool_id for tool_id in tool_ids if tool_id not in tool_to_module_key]
+
     if invalid_tools:
         console.print(f"[red]Error: Invalid tool IDs: {', '.join(invalid_tools)}[/red]")
-        console.print(f"[dim]Available tool IDs: {', '.join(sorted(list(valid_tool_ids)))}[/dim]")
+        console.print(f"[dim]Available tool IDs: {', '.join(sorted(tool_to_module_key))}[/dim]")
         return
 
     try:
         # Organize tools by module
         tool_modules_map = {} # Renamed from tool_modules to avoid conflict with loop var
         for tool_id in tool_ids:
-            # Iterate over the dynamically loaded modules
-            for module in ALL_TOOL_MODULES:
-                if hasattr(module, tool_id):
-                    module_name_key = module.__name__.split(".")[-1]
-                    if module_name_key not in tool_modules_map:
-                        tool_modules_map[module_name_key] = []
-                    tool_modules_map[module_name_key].append(tool_id)
-                    break
-        
+            tool_modules_map.setdefault(tool_to_module_key[tool_id], []).append(tool_id)
+
+
         # --- Refactored server file generation ---
         os.makedirs("servers", exist_ok=True)
         
-        # 1. Prepare strings for template substitution
+        # 1. Prepare strings for template substitution. Modules and tools are
+        # sorted so the same tool set always renders byte-identical output
+        # regardless of --tools order; that keeps the content-hash image tag
+        # and Docker layer cache stable across invocations.
         server_name = name
-        # Use keys from tool_modules_map for module_keys_string
-        module_keys_string = ", ".join(tool_modules_map.keys()) 
-        specific_tool_imports_string = "\n".join(
-            f'from mcp_host.tools.{module_name} import {", ".join(selected_tools)}'
-            for module_name, selected_tools in tool_modules_map.items()
+        module_keys_string = ", ".join(sorted(tool_modules_map))
+        # Compact module:tool,tool;module:tool spec consumed by the template's
+        # import loop (a bare import block would not parse pre-substitution).
+        specific_tool_spec_string = ";".join(
+            f'{module_name}:{",".join(sorted(tool_modules_map[module_name]))}'
+            for module_name in sorted(tool_modules_map)
         )
 
         try:
-            # Correct path assuming main.py is in mcp_host/cli/ and template is mcp_host/cli/server_template.py
-            template_path = os.path.join(os.path.dirname(__file__), "server_template.py")
-            with open(template_path, "r") as f:
-                template_content = f.read()
+            template_content = _load_template()
         except FileNotFoundError:
-            console.print(f"[red]Error: Server template file not found at {template_path}[/red]")
+            console.print("[red]Error: Server template file not found next to this module[/red]")
             return
 
-        # 4. Substitute placeholders in the template
-        server_code = template_content.replace("{{SERVER_NAME}}", server_name)
-        server_code = server_code.replace("{{SPECIFIC_TOOL_IMPORTS}}", specific_tool_imports_string)
-        server_code = server_code.replace("{{TOOL_MODULES}}", module_keys_string)
+        # 4. Substitute all placeholders in one linear pass over the template
+        server_code = string.Template(template_content).substitute(
+            SERVER_NAME=server_name,
+            SPECIFIC_TOOL_SPEC=specific_tool_spec_string,
+            TOOL_MODULES=module_keys_string,
+        )
         
-        # 5. Write the final server script to servers/{name}.py
+        # 5. Write the final server script to servers/{name}.py via a temp
+        # file and atomic rename, so a crash mid-write never leaves a
+        # truncated script behind.
         server_py_path = f"servers/{server_name}.py"
-        with open(server_py_path, "w") as f:
+        tmp_path = f"servers/.{server_name}.py.tmp"
+        with open(tmp_path, "w") as f:
             f.write(server_code)
+        os.replace(tmp_path, server_py_path)
         # --- End of refactored server file generation ---
         
         console.print(f"[green]Successfully created server '{server_name}'[/green]")
@@ -303,11 +473,12 @@ def deploy_server(
 
     try:
         # Create temporary deployment manager with project override if provided
-        deploy_manager = deployment_manager
+        deploy_manager = _get_deployment_manager()
         if project:
+            from ..backend.deployment import DeploymentManager
             deploy_manager = DeploymentManager(
                 project_id=project,
-                region=deployment_manager.region
+                region=deploy_manager.region
             )
             console.print(f"[yellow]Using project: {project}[/yellow]")
 
@@ -328,20 +499,44 @@ def list_servers():
         console.print("[yellow]No servers found[/yellow]")
         return
 
-    table = Table(title="Deployed Servers")
-    table.add_column("Name", style="cyan")
-    table.add_column("Status", style="green")
+    table = Table(title="Deployed Servers", padding=(0, 1), pad_edge=False)
+    table.add_column("Name", style="cyan", min_width=12)
+    table.add_column("Status", style="green", width=12)
     table.add_column("URL", style="magenta")
 
-    for server_file in os.listdir("servers"):
-        if server_file.endswith(".py"):
-            name = server_file[:-3]
+    # scandir streams DirEntry objects with type info from the kernel batch,
+    # avoiding a per-name stat when filtering to plain .py files.
+    with os.scandir("servers") as entries:
+        names = [
+            entry.name[:-3]
+            for entry in entries
+            if entry.is_file() and entry.name.endswith(".py")
+        ]
+
+    # One batched list call instead of a describe round trip per server file;
+    # if that fails, fall back to per-name lookups fanned out over threads so
+    # the worst case is one RTT rather than one per server.
+    try:
+        deployed = {
+            service["name"]: service["url"]
+            for service in _get_deployment_manager().list_deployed_services()
+        }
+    except Exception:
+        from concurrent.futures import ThreadPoolExecutor
+
+        def _safe_get_url(name):
             try:
-                service_url = deployment_manager.get_service_url(name)
-                status = "Running" if service_url else "Not Deployed"
-                table.add_row(name, status, service_url or "N/A")
+                return _get_deployment_manager().get_service_url(name)
             except Exception:
-                table.add_row(name, "Error", "N/A")
+                return None
+
+        with ThreadPoolExecutor(max_workers=min(16, len(names) or 1)) as pool:
+            deployed = dict(zip(names, pool.map(_safe_get_url, names)))
+
+    for name in names:
+        service_url = deployed.get(name)
+        status = "Running" if service_url else "Not Deployed"
+        table.add_row(name, status, service_url or "N/A")
 
     console.print(table)
 
@@ -356,10 +551,11 @@ def delete_server(
         return
 
     try:
-        # Delete from Cloud Run
+        # Delete from Cloud Run. The CLI removes the server file itself below,
+        # so skip the manager's own local-file cleanup to avoid a double remove.
         console.print(f"[yellow]Deleting server '{name}' from Cloud Run...[/yellow]")
-        deployment_manager.delete_server(name)
-        
+        _get_deployment_manager().delete_server(name, delete_local_file=False)
+
         # Remove server file
         os.remove(server_file)
         console.print(f"[green]Successfully deleted server '{name}'[/green]")
@@ -372,7 +568,7 @@ def get_server_url(
 ):
     """Get the URL of a deployed MCP server."""
     console.print(f"[yellow]Fetching URL for server '{name}'...[/yellow]")
-    service_url = deployment_manager.get_service_url(name)
+    service_url = _get_deployment_manager().get_service_url(name)
 
     if service_url:
         console.print(Panel(f"Server URL: {service_url}", title=f"URL for {name}"))
@@ -386,10 +582,13 @@ def get_server_capabilities(
 ):
     """Generate a client script for an MCP server."""
     if not url:
-        url = deployment_manager.get_service_url(name) + "/sse"
-        if not url:
+        # Only the name-lookup path touches Cloud Run; an explicit --url never
+        # constructs the deployment manager.
+        service_url = _get_deployment_manager().get_service_url(name)
+        if not service_url:
             console.print(f"[red]Error: Server '{name}' not found[/red]")
             return
+        url = service_url.rstrip("/") + "/sse"
     asyncio.run(discover_mcp_capabilities(url))
 
 def print_items(name: str, items_list: list) -> None:
@@ -399,18 +598,22 @@ def print_items(name: str, items_list: list) -> None:
         name: Category name (e.g., "tools", "resources", "prompts")
         items_list: A list of items to print.
     """
-    print(f"\nAvailable {name}:")
+    # Assemble the whole block and emit it with one write: a single stdout
+    # lock acquisition and syscall instead of one per item.
     if items_list:
-        for item in items_list:
-            print(f" * {item}")
+        body = "".join(f" * {item}\n" for item in items_list)
     else:
-        print(f"No {name} available.")
+        body = f"No {name} available.\n"
+    sys.stdout.write(f"\nAvailable {name}:\n{body}")
 
 async def discover_mcp_capabilities(server_sse_url: str):
     """
     Connects to an MCP server via SSE, initializes a session,
     and lists its available tools, resources, and prompts.
     """
+    from mcp.client.session import ClientSession
+    from mcp.client.sse import sse_client
+
     print(f"Attempting to connect to MCP server at SSE endpoint: {server_sse_url}")
 
     try:
@@ -425,19 +628,17 @@ async def discover_mcp_capabilities(server_sse_url: str):
                 print("MCP session initialized successfully.")
                 print("-" * 30) # Separator
 
-                # Fetch and print tools
-                tools_result = await session.list_tools()
-                # Assuming tools_result is an object with a 'tools' attribute list
-                # or the result itself is the list. Adjust if the structure is different.
-                # Example: if tools_result is like {'tools': ['tool1', 'tool2']}
+                # The three listings are independent; issue them concurrently so
+                # the total cost is one round trip instead of three.
+                tools_result, resources_result, prompts_result = await asyncio.gather(
+                    session.list_tools(),
+                    session.list_resources(),
+                    session.list_prompts(),
+                )
+                # Assuming each result is an object with the matching attribute
+                # list (e.g. tools_result like {'tools': ['tool1', 'tool2']}).
                 print_items("tools", getattr(tools_result, 'tools', [])) # Safely get 'tools' or empty list
-
-                # Fetch and print resources
-                resources_result = await session.list_resources()
                 print_items("resources", getattr(resources_result, 'resources', []))
-
-                # Fetch and print prompts
-                prompts_result = await session.list_prompts()
                 print_items("prompts", getattr(prompts_result, 'prompts', []))
 
                 print("-" * 30)
@@ -456,6 +657,11 @@ async def discover_mcp_capabilities(server_sse_url: str):
         # traceback.print_exc()
         sys.exit(1)
 
+# Bare identifiers like "add" can never be Python literals (True/False/None
+# aside), so call_tool skips the ast.literal_eval compile for them entirely.
+_BARE_WORD_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*\Z")
+_LITERAL_WORDS = frozenset({"True", "False", "None"})
+
 @cli.command("call-tool")
 def call_tool(
     tool_name: str = typer.Argument(..., help="Name of the tool to call."),
@@ -486,8 +692,7 @@ def call_tool(
         if not name:
             console.print(f"[red]Error: Must define either --url or --name when calling a tool.[/red]")
             raise typer.Exit(code=1)
-        # Assuming deployment_manager is available in this scope.
-        resolved_url_base = deployment_manager.get_service_url(name)
+        resolved_url_base = _get_deployment_manager().get_service_url(name)
         if not resolved_url_base:
             console.print(f"[red]Error: Server '{name}' not found or its URL could not be retrieved.[/red]")
             raise typer.Exit(code=1)
@@ -497,11 +702,20 @@ def call_tool(
     parsed_tool_kwargs: Dict[str, Any] = {}
     if tool_args:
         for arg_pair in tool_args:
-            if "=" not in arg_pair:
+            # partition validates and splits in one scan, where the old
+            # "in" check plus split(...) walked the string twice; interned
+            # keys hit CPython's fast unicode dict lookup path downstream.
+            key, sep, value_str = arg_pair.partition("=")
+            if not sep:
                 console.print(f"[yellow]Warning: Skipping malformed tool argument '[b]{arg_pair}[/b]'. Expected format: key=value.[/yellow]")
                 continue
-            
-            key, value_str = arg_pair.split("=", 1)
+            key = sys.intern(key)
+            # Fast path: a bare identifier (the common case, e.g. operation=add)
+            # can only ever fall through literal_eval to the raw string, so skip
+            # the AST compile and use it directly.
+            if value_str not in _LITERAL_WORDS and _BARE_WORD_RE.fullmatch(value_str):
+                parsed_tool_kwargs[key] = value_str
+                continue
             try:
                 # ast.literal_eval is safer than eval and can parse Python literals:
                 # strings, numbers, tuples, lists, dicts, booleans, None.
@@ -527,6 +741,9 @@ async def call_mcp_tool(server_sse_url: str, tool_name: str, **tool_kwargs):
     Connects to an MCP server via SSE, initializes a session,
     and calls a specified tool with the given arguments.
     """
+    from mcp.client.session import ClientSession
+    from mcp.client.sse import sse_client
+
     print(f"Attempting to connect to MCP server at SSE endpoint: {server_sse_url}")
     print(f"Attempting to call tool '{tool_name}' with arguments: {tool_kwargs}")
 
@@ -572,34 +789,5 @@ async def call_mcp_tool(server_sse_url: str, tool_name: str, **tool_kwargs):
         # traceback.print_exc() # Uncomment for more detailed debugging
         sys.exit(1)
 
-def get_tool_info(module):
-    """Get tool information from a module."""
-    tools = []
-    # Instead of looking for attributes, just collect all functions with docstrings
-    # that appear to be MCP tools (taking ctx as first parameter)
-    for name, func in inspect.getmembers(module, inspect.isfunction):
-        # Skip helper or internal functions
-        if name.startswith('_'):
-            continue
-        
-        # Get signature to check for Context parameter
-        try:
-            sig = inspect.signature(func)
-            params = list(sig.parameters.keys())
-            # Check if it looks like an MCP tool (has ctx parameter)
-            if len(params) > 0 and params[0] == 'ctx':
-                tools.append({
-                    "id": name,
-                    "name": name.replace("_", " ").title(),
-                    "description": func.__doc__ or "",
-                    "version": "0.1.0", 
-                    "author": "MCP Hosting Service"
-                })
-        except (ValueError, TypeError):
-            # Skip functions with invalid signatures
-            pass
-            
-    return tools
-
 def main():
     cli() 
\ No newline at end of file
@@ -1,57 +1,101 @@
-# Generated MCP server for {{SERVER_NAME}}
+# Generated MCP server for ${SERVER_NAME}
 
-from mcp.server.fastmcp import Context, FastMCP
-from contextlib import asynccontextmanager
-from collections.abc import AsyncIterator
-from dataclasses import dataclass
-import os
-import importlib
-from mcp.server import Server
-from starlette.applications import Starlette
-from starlette.requests import Request
-from starlette.routing import Mount, Route
-from mcp.server.sse import SseServerTransport
-import uvicorn
+# Only stdlib modules are imported at module scope so that argparse can run —
+# and --help or a bad flag can exit — before the MCP/Starlette/tool dependency
+# graph is loaded. The heavy imports happen in _load_app() after parsing.
 import argparse
-from starlette.responses import PlainTextResponse
-from mcp_host.app_setup import mcp_app
+import importlib
 import logging
+import os
+import sys
+
+log = logging.getLogger(__name__)
+
+def _load_app():
+    """Import the shared FastMCP app and the configured tool modules.
+
+    Deferred until after argument parsing so startup-error paths never pay
+    for httpx, duckduckgo_search and friends.
+    """
+    from mcp_host.app_setup import mcp_app
+
+    # Warm the async-HTTP stack's transitive deps up front so the first SSE
+    # request never runs importlib inside the event loop; sniffio in
+    # particular is probed by httpcore on every request.
+    try:
+        import anyio  # noqa: F401
+        import h11  # noqa: F401
+        import httpcore  # noqa: F401
+        import sniffio  # noqa: F401
+    except ImportError:
+        pass
+
+    # Local binds shared by both loops below: repeated keys or an
+    # already-imported module skip the full finder/loader walk.
+    modules = sys.modules
+    import_module = importlib.import_module
+
+    # --- Dynamically import tool modules ---
+    try:
+        tool_module_keys_str = "${TOOL_MODULES}"
+        if tool_module_keys_str:
+            # Deduplicate keys and check sys.modules before asking importlib.
+            tool_module_keys = dict.fromkeys(key.strip() for key in tool_module_keys_str.split(',') if key.strip())
+            for key in tool_module_keys:
+                # This makes the module available, e.g., mcp_host.tools.weather
+                # The specific tools from these modules are imported in the next block.
+                name = f"mcp_host.tools.{key}"
+                if name not in modules:
+                    import_module(name)
+                log.info("Dynamically imported module mcp_host.tools.%s", key)
+    except Exception as e:
+        log.error("Failed to load tool modules from the string '%s': %s", tool_module_keys_str, e, exc_info=True)
 
-# --- Dynamically import tool modules ---
-try:
-    tool_module_keys_str = "{{TOOL_MODULES}}"
-    if tool_module_keys_str:
-        tool_module_keys = [key.strip() for key in tool_module_keys_str.split(',') if key.strip()]
-        for key in tool_module_keys:
-            # This makes the module available, e.g., mcp_host.tools.weather
-            # The specific tools from these modules are imported in the next block.
-            importlib.import_module(f"mcp_host.tools.{key}")
-            logging.info(f"Dynamically imported module mcp_host.tools.{key}") # Changed to logging.info
-except Exception as e:
-    logging.error(f"Failed to load tool modules from the string '{tool_module_keys_str}': {e}", exc_info=True) # Changed to logging.error
-
-# --- Import specific tools ---
-# This block will be replaced by the create_server command with concrete import statements
-# e.g., from mcp_host.tools.weather import get_weather
-# These imports make the tool functions directly available to FastMCP if it discovers them from globals,
-# or if they self-register upon import.
-{{SPECIFIC_TOOL_IMPORTS}}
+    # --- Import specific tools ---
+    # create_server fills in a compact "module:tool,tool;module:tool" spec below.
+    # The named tools are bound into this module's globals so FastMCP can discover
+    # them there (they also self-register upon module import above).
+    _SPECIFIC_TOOL_SPEC = "${SPECIFIC_TOOL_SPEC}"
+    for _module_spec in filter(None, _SPECIFIC_TOOL_SPEC.split(";")):
+        _module_key, _, _tool_names = _module_spec.partition(":")
+        # The loop above already imported every configured module, so this
+        # resolves from sys.modules with no importlib descent; the getattr
+        # binds replace what would otherwise be one `from ... import` per
+        # module.
+        _tool_module = modules.get(f"mcp_host.tools.{_module_key}") or import_module(f"mcp_host.tools.{_module_key}")
+        for _tool_name in filter(None, _tool_names.split(",")):
+            globals()[_tool_name] = getattr(_tool_module, _tool_name)
+
+    return mcp_app
 
 # --- Helper function to create Starlette app with SSE ---
-def create_starlette_app(mcp_server: Server, *, debug: bool = False) -> Starlette:
+def create_starlette_app(mcp_server, *, debug: bool = False):
     """Create a Starlette application that can serve the provided MCP server with SSE."""
+    from mcp.server.sse import SseServerTransport
+    from starlette.applications import Starlette
+    from starlette.requests import Request
+    from starlette.responses import PlainTextResponse
+    from starlette.routing import Mount, Route
+
     sse_transport = SseServerTransport("/messages/") # Path for SSE message exchange
 
+    # Built once: a Starlette response is stateless in __call__, so sharing
+    # one instance means liveness probes cost no response-object or header
+    # construction per hit.
+    ok_response = PlainTextResponse("OK")
+
     async def handle_sse(request: Request) -> None:
         """Handles the SSE connection for the MCP server."""
-        logging.debug(f"SSE connection request: {request}")
+        # %-style args are only formatted if DEBUG is enabled, so at the INFO
+        # default these calls are a level check and nothing more.
+        log.debug("SSE connection request: %s", request)
         try:
             async with sse_transport.connect_sse(
                     request.scope,
                     request.receive,
                     request._send,  # noqa: SLF001 - Accessing protected member for Starlette integration
             ) as (read_stream, write_stream):
-                logging.debug(f"SSE connection established. Running mcp_server...")
+                log.debug("SSE connection established. Running mcp_server...")
                 try:
                     await mcp_server.run(
                         read_stream,
@@ -59,19 +103,19 @@ def create_starlette_app(mcp_server: Server, *, debug: bool = False) -> Starlett
                         mcp_server.create_initialization_options(),
                     )
                 except Exception as e:
-                    logging.error(f"Error running MCP server: {e}", exc_info=True)
+                    log.error("Error running MCP server: %s", e, exc_info=True)
                     raise
         except Exception as e:
-            logging.error(f"Error handling SSE connection: {e}", exc_info=True)
+            log.error("Error handling SSE connection: %s", e, exc_info=True)
             raise
-        
+
 
     async def health_check(request: Request) -> PlainTextResponse:
         """Simple health check endpoint."""
-        logging.debug(f"Health check requested for {request.url}")
-        return PlainTextResponse("OK")
+        log.debug("Health check requested for %s", request.url)
+        return ok_response
 
-    logging.debug("Creating Starlette app with routes...")
+    log.debug("Creating Starlette app with routes...")
     return Starlette(
         debug=debug,
         routes=[
@@ -82,46 +126,79 @@ def create_starlette_app(mcp_server: Server, *, debug: bool = False) -> Starlett
     )
 
 if __name__ == "__main__":
-    # Configure basic logging
+    # Configure basic logging. INFO by default; set LOG_LEVEL=DEBUG to get the
+    # per-connection diagnostics — at DEBUG every SSE request serializes log
+    # records through the root logger.
     logging.basicConfig(
-        level=logging.DEBUG,
+        level=os.environ.get("LOG_LEVEL", "INFO").upper(),
         format='%(asctime)s - %(levelname)s - %(name)s - %(message)s'
     )
 
     # For containerized environments, HOST should be 0.0.0.0.
     # PORT environment variable is respected as a default for the port.
-    
-    parser = argparse.ArgumentParser(description=f"Run MCP SSE-based server for {{SERVER_NAME}}")
+
+    parser = argparse.ArgumentParser(description=f"Run MCP SSE-based server for ${SERVER_NAME}")
     parser.add_argument('--host', default=os.environ.get("HOST", "0.0.0.0"), help='Host to bind to. Defaults to HOST env var or 0.0.0.0.')
     parser.add_argument('--port', type=int, default=int(os.environ.get("PORT", 8080)), help='Port to listen on. Defaults to PORT env var or 8080.')
     parser.add_argument('--debug', action='store_true', help='Enable debug mode for Starlette.')
+    parser.add_argument('--access-log', action='store_true', help='Enable uvicorn access logging (off by default; it costs a log record per request).')
     args = parser.parse_args()
 
-    logging.info(f"Attempting to start server '{{SERVER_NAME}}' on http://{args.host}:{args.port}") # Changed to logging.info
-    logging.debug(f"Parsed arguments: host={args.host}, port={args.port}, debug={args.debug}")
-    logging.debug(f"mcp_app instance: {mcp_app}")
+    log.info("Attempting to start server '${SERVER_NAME}' on http://%s:%s", args.host, args.port)
+    log.debug("Parsed arguments: host=%s, port=%s, debug=%s", args.host, args.port, args.debug)
+
+    # Arguments are valid; now pay for the framework and tool imports.
+    mcp_app = _load_app()
 
     # Access the underlying MCP Server from the FastMCP instance
     # Note: WPS437 suggests avoiding private members, but this is a common pattern for such integrations.
     mcp_server_instance = mcp_app._mcp_server # noqa: WPS437
-    logging.debug(f"mcp_server_instance from mcp_app: {mcp_server_instance}")
 
     if mcp_server_instance is None:
-        logging.error("mcp_app._mcp_server is None. Cannot start server.")
-        import sys
+        log.error("mcp_app._mcp_server is None. Cannot start server.")
         sys.exit(1)
 
     # Create the Starlette application
-    logging.debug("Creating Starlette application...")
     starlette_app = create_starlette_app(mcp_server_instance, debug=args.debug)
-    logging.debug("Starlette application created.")
+
+    # Liveness probes to "/" short-circuit ahead of Starlette's router: two
+    # prebuilt ASGI messages, no route matching and no response objects.
+    # Everything else passes straight through to the Starlette app.
+    _OK_START = {
+        "type": "http.response.start",
+        "status": 200,
+        "headers": [(b"content-type", b"text/plain; charset=utf-8"), (b"content-length", b"2")],
+    }
+    _OK_BODY = {"type": "http.response.body", "body": b"OK"}
+
+    async def asgi_app(scope, receive, send):
+        if scope["type"] == "http" and scope["path"] == "/":
+            await send(_OK_START)
+            await send(_OK_BODY)
+            return
+        await starlette_app(scope, receive, send)
 
     # Run the server with Uvicorn
-    logging.debug(f"Starting Uvicorn server on http://{args.host}:{args.port} with debug={args.debug}...")
+    import uvicorn
+
+    # Prefer the C event loop and HTTP parser when they are installed; fall
+    # back to uvicorn's auto-detection so their absence is never fatal.
+    try:
+        import uvloop  # noqa: F401
+        loop_impl = "uvloop"
+    except ImportError:
+        loop_impl = "auto"
+    try:
+        import httptools  # noqa: F401
+        http_impl = "httptools"
+    except ImportError:
+        http_impl = "auto"
+
+    log.debug("Starting Uvicorn server on http://%s:%s with debug=%s...", args.host, args.port, args.debug)
     try:
-        uvicorn.run(starlette_app, host=args.host, port=args.port)
+        uvicorn.run(asgi_app, host=args.host, port=args.port,
+                    loop=loop_impl, http=http_impl, access_log=args.access_log)
     except Exception as e:
-        logging.error(f"Uvicorn failed to start or encountered an error while running server {{SERVER_NAME}} on {args.host}:{args.port}: {e}", exc_info=True) # Changed to logging.error
-        import sys
+        log.error("Uvicorn failed to start or encountered an error while running server ${SERVER_NAME} on %s:%s: %s", args.host, args.port, e, exc_info=True)
         sys.exit(1)
-    logging.debug("Uvicorn server stopped.")
\ No newline at end of file
+    log.debug("Uvicorn server stopped.")
@@ -4,9 +4,92 @@ Sample calculator tool implementation.
 
 from typing import Dict, Any, List
 import math
+from statistics import median as _median
 from mcp.server.fastmcp import Context
 from mcp_host import app_setup
 
+# NumPy is optional: when present, large inputs take vectorized reductions
+# instead of interpreter loops. Below _VECTOR_MIN elements the array
+# conversion costs more than it saves, so small inputs stay pure Python.
+try:
+    import numpy as _np
+except ImportError:
+    _np = None
+
+_VECTOR_MIN = 64
+
+# Numba is optional too: the divide reduction is inherently sequential, so
+# NumPy can't vectorize it, but njit compiles the loop to machine code.
+# cache=True persists the compiled function across restarts, and the warmup
+# call below moves any remaining JIT cost to module import (which generated
+# servers defer until after argument parsing) instead of the first request.
+_divide_reduce = None
+if _np is not None:
+    try:
+        from numba import njit as _njit
+    except ImportError:
+        pass
+    else:
+        @_njit(cache=True, fastmath=True)
+        def _divide_reduce(arr):
+            r = arr[0]
+            for i in range(1, arr.size):
+                r /= arr[i]
+            return r
+
+        _divide_reduce(_np.ones(2))
+
+# Degrees-to-radians as a constant multiply instead of a math.radians call
+# per invocation, and local aliases for the math functions so the hot path
+# skips the module attribute lookup.
+_DEG2RAD = math.pi / 180.0
+_sqrt = math.sqrt
+_sin = math.sin
+_cos = math.cos
+_tan = math.tan
+_log = math.log
+
+
+def _divide(numbers: List[float]) -> float:
+    # all() short-circuits on the first zero in a single pass, where the old
+    # `0 in numbers[1:]` membership test walked the tail before dividing.
+    if not all(numbers[1:]):
+        raise ValueError("Division by zero")
+    result = numbers[0]
+    for n in numbers[1:]:
+        result /= n
+    return result
+
+
+def _guarded_sqrt(number: float) -> float:
+    if number < 0:
+        raise ValueError("Cannot calculate square root of negative number")
+    return _sqrt(number)
+
+
+def _guarded_log(number: float) -> float:
+    if number <= 0:
+        raise ValueError("Cannot calculate logarithm of non-positive number")
+    return _log(number)
+
+
+# Jump tables: one dict lookup dispatches an operation instead of walking an
+# if/elif ladder of string compares, and stay O(1) as operations are added.
+_BASIC_OPS = {
+    "add": sum,
+    "subtract": lambda numbers: numbers[0] - sum(numbers[1:]),
+    "multiply": math.prod,
+    "divide": _divide,
+}
+
+_ADVANCED_OPS = {
+    "sqrt": _guarded_sqrt,
+    "sin": lambda number: _sin(number * _DEG2RAD),
+    "cos": lambda number: _cos(number * _DEG2RAD),
+    "tan": lambda number: _tan(number * _DEG2RAD),
+    "log": _guarded_log,
+}
+
 @app_setup.mcp_app.tool()
 def basic_math(ctx: Context, operation: str, numbers: List[float]) -> Dict[str, Any]:
     """Perform basic mathematical operations.
@@ -21,22 +104,22 @@ def basic_math(ctx: Context, operation: str, numbers: List[float]) -> Dict[str,
     """
     if not numbers:
         raise ValueError("At least one number is required")
-        
-    if operation == "add":
-        result = sum(numbers)
-    elif operation == "subtract":
-        result = numbers[0] - sum(numbers[1:])
-    elif operation == "multiply":
-        result = math.prod(numbers)
-    elif operation == "divide":
-        if 0 in numbers[1:]:
+
+    if _np is not None and len(numbers) >= _VECTOR_MIN and operation in ("add", "multiply"):
+        arr = _np.asarray(numbers, dtype=_np.float64)
+        result = float(arr.sum() if operation == "add" else arr.prod())
+    elif _divide_reduce is not None and operation == "divide" and len(numbers) >= _VECTOR_MIN:
+        arr = _np.asarray(numbers, dtype=_np.float64)
+        if not arr[1:].all():
             raise ValueError("Division by zero")
-        result = numbers[0]
-        for n in numbers[1:]:
-            result /= n
+        result = float(_divide_reduce(arr))
     else:
-        raise ValueError(f"Invalid operation: {operation}")
-        
+        try:
+            op = _BASIC_OPS[operation]
+        except KeyError:
+            raise ValueError(f"Invalid operation: {operation}") from None
+        result = op(numbers)
+
     return {
         "operation": operation,
         "numbers": numbers,
@@ -55,23 +138,12 @@ def advanced_math(ctx: Context, operation: str, number: float) -> Dict[str, Any]
     Returns:
         Dict containing the result
     """
-    if operation == "sqrt":
-        if number < 0:
-            raise ValueError("Cannot calculate square root of negative number")
-        result = math.sqrt(number)
-    elif operation == "sin":
-        result = math.sin(math.radians(number))
-    elif operation == "cos":
-        result = math.cos(math.radians(number))
-    elif operation == "tan":
-        result = math.tan(math.radians(number))
-    elif operation == "log":
-        if number <= 0:
-            raise ValueError("Cannot calculate logarithm of non-positive number")
-        result = math.log(number)
-    else:
-        raise ValueError(f"Invalid operation: {operation}")
-        
+    try:
+        op = _ADVANCED_OPS[operation]
+    except KeyError:
+        raise ValueError(f"Invalid operation: {operation}") from None
+    result = op(number)
+
     return {
         "operation": operation,
         "number": number,
@@ -91,11 +163,21 @@ def statistics(ctx: Context, numbers: List[float]) -> Dict[str, Any]:
     """
     if not numbers:
         raise ValueError("At least one number is required")
-        
+
+    if _np is not None and len(numbers) >= _VECTOR_MIN:
+        arr = _np.asarray(numbers, dtype=_np.float64)
+        return {
+            "mean": float(arr.mean()),
+            "median": float(_np.median(arr)),
+            "min": float(arr.min()),
+            "max": float(arr.max()),
+            "count": int(arr.size)
+        }
+
     return {
         "mean": sum(numbers) / len(numbers),
-        "median": sorted(numbers)[len(numbers) // 2],
+        "median": _median(numbers),
         "min": min(numbers),
         "max": max(numbers),
         "count": len(numbers)
-    } 
\ No newline at end of file
+    }
\ No newline at end of file
@@ -2,16 +2,33 @@
 Sample calendar tool implementation.
 """
 
+import asyncio
 from typing import Dict, Any, List
+from bisect import bisect_left, bisect_right, insort
 from datetime import datetime, timedelta
+from itertools import count
 from mcp.server.fastmcp import Context
 from mcp_host import app_setup
 
-# Initialize events storage
-events = []
+# Events keyed by id (insertion-ordered): lookups and deletions are one dict
+# operation instead of a linear scan plus a tail-shifting list.pop. The
+# counter never reuses an id after a deletion, unlike len(events) + 1.
+events: Dict[int, Dict[str, Any]] = {}
+_next_id = count(1)
+
+# Parallel index of (start datetime, id) kept sorted at insert time, so
+# list_events range queries are a binary search instead of re-parsing every
+# event's ISO string on every call.
+_starts: List[tuple] = []
+
+# Guards events and _starts together: once an async tool yields, unprotected
+# mutations could interleave and leave the index out of step with the dict.
+# Parsing and formatting happen outside the lock to keep the critical
+# sections as short as possible.
+_events_lock = asyncio.Lock()
 
 @app_setup.mcp_app.tool()
-def create_event(ctx: Context, title: str, start_time: str, duration_minutes: int = 60) -> Dict[str, Any]:
+async def create_event(ctx: Context, title: str, start_time: str, duration_minutes: int = 60) -> Dict[str, Any]:
     """Create a new calendar event.
     
     Args:
@@ -26,19 +43,22 @@ def create_event(ctx: Context, title: str, start_time: str, duration_minutes: in
     start = datetime.fromisoformat(start_time)
     end = start + timedelta(minutes=duration_minutes)
     
-    event = {
-        "id": len(events) + 1,
-        "title": title,
-        "start_time": start.isoformat(),
-        "end_time": end.isoformat(),
-        "duration_minutes": duration_minutes
-    }
-    
-    events.append(event)
+    async with _events_lock:
+        event_id = next(_next_id)
+        event = {
+            "id": event_id,
+            "title": title,
+            "start_time": start.isoformat(),
+            "end_time": end.isoformat(),
+            "duration_minutes": duration_minutes
+        }
+
+        events[event_id] = event
+        insort(_starts, (start, event_id))
     return event
 
 @app_setup.mcp_app.tool()
-def list_events(ctx: Context, start_date: str, end_date: str) -> List[Dict[str, Any]]:
+async def list_events(ctx: Context, start_date: str, end_date: str) -> List[Dict[str, Any]]:
     """List events within a date range.
     
     Args:
@@ -51,14 +71,16 @@ def list_events(ctx: Context, start_date: str, end_date: str) -> List[Dict[str,
     """
     start = datetime.fromisoformat(start_date)
     end = datetime.fromisoformat(end_date)
-    
-    return [
-        event for event in events
-        if start <= datetime.fromisoformat(event["start_time"]) <= end
-    ]
+
+    # O(log N) to find the window boundaries, O(K) to materialize matches,
+    # returned in chronological order.
+    async with _events_lock:
+        lo = bisect_left(_starts, (start,))
+        hi = bisect_right(_starts, (end, float("inf")))
+        return [events[event_id] for _, event_id in _starts[lo:hi]]
 
 @app_setup.mcp_app.tool()
-def delete_event(ctx: Context, event_id: int) -> Dict[str, Any]:
+async def delete_event(ctx: Context, event_id: int) -> Dict[str, Any]:
     """Delete a calendar event.
     
     Args:
@@ -68,7 +90,10 @@ def delete_event(ctx: Context, event_id: int) -> Dict[str, Any]:
     Returns:
         Dict containing the deleted event
     """
-    for i, event in enumerate(events):
-        if event["id"] == event_id:
-            return events.pop(i)
-    raise ValueError(f"Event with ID {event_id} not found") 
\ No newline at end of file
+    async with _events_lock:
+        try:
+            event = events.pop(event_id)
+        except KeyError:
+            raise ValueError(f"Event with ID {event_id} not found") from None
+        _starts.remove((datetime.fromisoformat(event["start_time"]), event_id))
+    return event 
\ No newline at end of file
@@ -2,75 +2,100 @@
 Sample search tool implementation.
 """
 
+import asyncio
 from typing import Dict, Any, List
 from mcp.server.fastmcp import Context
 from duckduckgo_search import DDGS
 from mcp_host import app_setup
 
-# Initialize search client
-search_client = DDGS()
+# One DDGS client for the life of the process, created on first use: every
+# search reuses its internal HTTP session (warm connections) instead of
+# paying a handshake per query, and server startup skips the client setup
+# when no search tool is ever called. DDGS offers no hook to inject an
+# external httpx client, so sharing its own session is the pooling
+# available without forking the library.
+_search_client = None
+
+def _get_search_client() -> DDGS:
+    global _search_client
+    if _search_client is None:
+        _search_client = DDGS(timeout=30)
+    return _search_client
+
+# The DDGS calls are blocking HTTP round trips; the tool entry points are
+# async and push them onto worker threads via asyncio.to_thread so a slow
+# search never stalls the event loop (and with it every SSE connection).
+
+def _do_web_search(query: str, max_results: int) -> List[Dict[str, Any]]:
+    results = []
+    for r in _get_search_client().text(query, max_results=max_results):
+        results.append({
+            "title": r["title"],
+            "link": r["link"],
+            "snippet": r["body"]
+        })
+    return results
+
+def _do_news_search(query: str, max_results: int) -> List[Dict[str, Any]]:
+    results = []
+    for r in _get_search_client().news(query, max_results=max_results):
+        results.append({
+            "title": r["title"],
+            "link": r["link"],
+            "source": r["source"],
+            "date": r["date"],
+            "snippet": r["body"]
+        })
+    return results
+
+def _do_image_search(query: str, max_results: int) -> List[Dict[str, Any]]:
+    results = []
+    for r in _get_search_client().images(query, max_results=max_results):
+        results.append({
+            "title": r["title"],
+            "image_url": r["image"],
+            "source_url": r["link"]
+        })
+    return results
 
 @app_setup.mcp_app.tool()
-def web_search(ctx: Context, query: str, max_results: int = 5) -> List[Dict[str, Any]]:
+async def web_search(ctx: Context, query: str, max_results: int = 5) -> List[Dict[str, Any]]:
     """Search the web for information.
-    
+
     Args:
         ctx: The MCP context
         query: Search query
         max_results: Maximum number of results to return
-        
+
     Returns:
         List of search results
     """
-    results = []
-    for r in search_client.text(query, max_results=max_results):
-        results.append({
-            "title": r["title"],
-            "link": r["link"],
-            "snippet": r["body"]
-        })
-    return results
+    return await asyncio.to_thread(_do_web_search, query, max_results)
 
 @app_setup.mcp_app.tool()
-def news_search(ctx: Context, query: str, max_results: int = 5) -> List[Dict[str, Any]]:
+async def news_search(ctx: Context, query: str, max_results: int = 5) -> List[Dict[str, Any]]:
     """Search for news articles.
-    
+
     Args:
         ctx: The MCP context
         query: Search query
         max_results: Maximum number of results to return
-        
+
     Returns:
         List of news articles
     """
-    results = []
-    for r in search_client.news(query, max_results=max_results):
-        results.append({
-            "title": r["title"],
-            "link": r["link"],
-            "source": r["source"],
-            "date": r["date"],
-            "snippet": r["body"]
-        })
-    return results
+    return await asyncio.to_thread(_do_news_search, query, max_results)
 
 @app_setup.mcp_app.tool()
-def image_search(ctx: Context, query: str, max_results: int = 5) -> List[Dict[str, Any]]:
+async def image_search(ctx: Context, query: str, max_results: int = 5) -> List[Dict[str, Any]]:
     """Search for images.
-    
+
     Args:
         ctx: The MCP context
         query: Search query
         max_results: Maximum number of results to return
-        
+
     Returns:
         List of image results
     """
-    results = []
-    for r in search_client.images(query, max_results=max_results):
-        results.append({
-            "title": r["title"],
-            "image_url": r["image"],
-            "source_url": r["link"]
-        })
-    return results 
\ No newline at end of file
+    return await asyncio.to_thread(_do_image_search, query, max_results)
@@ -5,26 +5,86 @@ Sample weather tool implementation.
 from typing import Any, Dict
 
 import logging
+import time
+
 import httpx
 
 from mcp.server.fastmcp import Context
 from mcp_host import app_setup
 
+# orjson parses the 20-100 KB NWS payloads several times faster than the
+# stdlib decoder behind response.json(); fall back cleanly if it's missing.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = None
+
 NWS_API_BASE = "https://api.weather.gov"
 USER_AGENT = "weather-app/1.0"
 
+# Precompiled period template: format_map pulls the fields straight from the
+# NWS period dict in one call instead of four subscripts plus f-string
+# assembly per period, and raises the same KeyError on missing fields.
+_PERIOD_FMT = (
+    "{name}:\n"
+    "  Temperature: {temperature}°{temperatureUnit}\n"
+    "  Wind: {windSpeed} {windDirection}\n"
+    "  Forecast: {detailedForecast}"
+)
+
+# The /points grid mapping for a coordinate is stable for days, so the
+# resolved forecast URL is cached for 24h keyed on coordinates rounded to
+# roughly the NWS grid resolution (~2.5 km). A cache hit halves the round
+# trips per forecast. The dict doubles as an LRU: hits are reinserted to
+# refresh their recency, and inserts evict expired entries first and then
+# the least recently used, so memory stays bounded no matter how many
+# distinct coordinates a public server sees.
+_POINTS_TTL = 86400.0
+_POINTS_CACHE_MAX = 1024
+_points_cache: Dict[tuple, tuple] = {}
+
+
+def _points_cache_get(cache_key: tuple) -> str | None:
+    cached = _points_cache.get(cache_key)
+    if cached is None or cached[0] <= time.monotonic():
+        return None
+    # Move to the end so hot coordinates survive eviction.
+    _points_cache[cache_key] = _points_cache.pop(cache_key)
+    return cached[1]
+
+
+def _points_cache_put(cache_key: tuple, forecast_url: str) -> None:
+    now = time.monotonic()
+    if len(_points_cache) >= _POINTS_CACHE_MAX:
+        for key in [k for k, v in _points_cache.items() if v[0] <= now]:
+            del _points_cache[key]
+        while len(_points_cache) >= _POINTS_CACHE_MAX:
+            del _points_cache[next(iter(_points_cache))]
+    _points_cache[cache_key] = (now + _POINTS_TTL, forecast_url)
+
+
+# One client for the life of the process: connections (TCP + TLS) are pooled
+# and reused across requests instead of being handshaken per call, and the
+# default headers are built once. get_forecast's two round trips share one
+# connection, as do concurrent forecasts.
+_client = httpx.AsyncClient(
+    headers={"User-Agent": USER_AGENT, "Accept": "application/geo+json"},
+    timeout=30.0,
+    limits=httpx.Limits(max_keepalive_connections=32, max_connections=128),
+)
+
 
 async def request_nws(url: str) -> dict[str, Any] | None:
     """Request the NWS API."""
-    headers = {"User-Agent": USER_AGENT, "Accept": "application/geo+json"}
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(url, headers=headers, timeout=30.0)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            logging.error(f"Error requesting NWS API: {e}")
-            return None
+    try:
+        response = await _client.get(url)
+        response.raise_for_status()
+        if _json_loads is not None:
+            return _json_loads(response.content)
+        return response.json()
+    except Exception as e:
+        logging.error(f"Error requesting NWS API: {e}")
+        return None
 
 
 @app_setup.mcp_app.tool()
@@ -38,29 +98,36 @@ async def get_forecast(ctx: Context, latitude: float, longitude: float) -> str:
     """
     logging.info(f"get_forecast called with latitude: {latitude}, longitude: {longitude}")
 
-    # First get the forecast grid endpoint
-    points_url = f"{NWS_API_BASE}/points/{latitude},{longitude}"
-    logging.info(f"Attempting to fetch points data from: {points_url}")
-    points_data = await request_nws(points_url)
-
-    if not points_data:
-        logging.error(f"Failed to fetch points_data for {latitude},{longitude}. request_nws returned None.")
-        return "Unable to fetch forecast data for this location (points data failed)."
+    cache_key = (round(latitude, 2), round(longitude, 2))
+    forecast_url = _points_cache_get(cache_key)
+    if forecast_url is not None:
+        logging.info(f"Using cached forecast_url for {cache_key}: {forecast_url}")
+    else:
+        # First get the forecast grid endpoint
+        points_url = f"{NWS_API_BASE}/points/{latitude},{longitude}"
+        logging.info(f"Attempting to fetch points data from: {points_url}")
+        points_data = await request_nws(points_url)
+
+        if not points_data:
+            logging.error(f"Failed to fetch points_data for {latitude},{longitude}. request_nws returned None.")
+            return "Unable to fetch forecast data for this location (points data failed)."
+
+        forecast_url: str | None = None
+        try:
+            forecast_url = points_data["properties"]["forecast"]
+            logging.info(f"Successfully extracted forecast_url: {forecast_url}")
+        except KeyError:
+            logging.exception(f"KeyError when trying to access ['properties']['forecast'] from points_data for {latitude},{longitude}. points_data: {points_data}")
+            return "Unable to parse forecast data from initial API response (missing forecast URL)."
+        except Exception:
+            logging.exception(f"An unexpected error occurred extracting forecast_url from points_data for {latitude},{longitude}. points_data: {points_data}")
+            return "Unexpected error processing initial forecast data."
 
-    forecast_url: str | None = None
-    try:
-        forecast_url = points_data["properties"]["forecast"]
-        logging.info(f"Successfully extracted forecast_url: {forecast_url}")
-    except KeyError:
-        logging.exception(f"KeyError when trying to access ['properties']['forecast'] from points_data for {latitude},{longitude}. points_data: {points_data}")
-        return "Unable to parse forecast data from initial API response (missing forecast URL)."
-    except Exception:
-        logging.exception(f"An unexpected error occurred extracting forecast_url from points_data for {latitude},{longitude}. points_data: {points_data}")
-        return "Unexpected error processing initial forecast data."
+        if not forecast_url: # Should be caught by KeyError, but as a safeguard
+            logging.error(f"forecast_url is None or empty after attempting to extract it for {latitude},{longitude}.")
+            return "Forecast URL was not found in the API response."
 
-    if not forecast_url: # Should be caught by KeyError, but as a safeguard
-        logging.error(f"forecast_url is None or empty after attempting to extract it for {latitude},{longitude}.")
-        return "Forecast URL was not found in the API response."
+        _points_cache_put(cache_key, forecast_url)
 
     logging.info(f"Attempting to fetch detailed forecast data from: {forecast_url}")
     forecast_data = await request_nws(forecast_url)
@@ -75,13 +142,7 @@ async def get_forecast(ctx: Context, latitude: float, longitude: float) -> str:
         forecasts = []
         for i, period in enumerate(periods[:5]):  # Get up to the first 5 periods
             try:
-                forecast = (
-                    f"{period['name']}:\n"
-                    f"  Temperature: {period['temperature']}°{period['temperatureUnit']}\n"
-                    f"  Wind: {period['windSpeed']} {period['windDirection']}\n"
-                    f"  Forecast: {period['detailedForecast']}"
-                )
-                forecasts.append(forecast)
+                forecasts.append(_PERIOD_FMT.format_map(period))
             except KeyError as e:
                 logging.exception(f"KeyError processing period #{i+1} from forecast_data. Period data: {period}. Missing key: {e}")
                 # Optionally skip this period or return an error message